@@ -746,8 +746,10 @@ class SampleCollection(object):
             a :class:`fiftyone.core.sample.Sample` or
             :class:`fiftyone.core.sample.SampleView`
         """
+        # Limit the pipeline rather than calling `iter(self)`, which would
+        # count the collection and open a cursor over all of its samples
         try:
-            return next(iter(self))
+            return next(self._iter_samples(pipeline=[{"$limit": 1}]))
         except StopIteration:
             raise ValueError("%s is empty" % self.__class__.__name__)
 
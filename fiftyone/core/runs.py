@@ -7,6 +7,7 @@ Dataset runs framework.
 """
 from copy import copy, deepcopy
 import datetime
+import json
 import logging
 
 from bson import json_util, DBRef
@@ -16,6 +17,7 @@ import eta.core.utils as etau
 
 import fiftyone.constants as foc
 from fiftyone.core.config import Config, Configurable
+import fiftyone.core.odm as foo
 from fiftyone.core.odm import patch_runs
 from fiftyone.core.odm.runs import RunDocument
 
@@ -46,6 +48,8 @@ class BaseRunInfo(Config):
 
     @classmethod
     def _from_doc(cls, doc):
+        # The config must not share nested containers with the document, or
+        # edits to it would be persisted the next time the document is saved
         return cls(
             key=doc.key,
             version=doc.version,
@@ -343,7 +347,7 @@ class BaseRun(Configurable):
                 % (self._run_str(), key)
             )
 
-        if key not in self.list_runs(samples):
+        if not self._has_run(samples, key):
             return
 
         if not overwrite:
@@ -353,7 +357,8 @@ class BaseRun(Configurable):
             )
 
         try:
-            existing_info = self.get_run_info(samples, key)
+            run_doc = self._get_run_doc(samples, key)
+            existing_info = self._get_cached_run_info(key, run_doc)
         except:
             # If the old info can't be loaded, always let the user overwrite it
             return
@@ -436,9 +441,9 @@ class BaseRun(Configurable):
             return sorted(run_docs.keys())
 
         keys = []
-        for key in run_docs.keys():
+        for key, run_doc in run_docs.items():
             try:
-                run_info = cls.get_run_info(samples, key)
+                run_info = cls._get_cached_run_info(key, run_doc)
                 config = run_info.config
             except:
                 logger.warning(
@@ -479,14 +484,15 @@ class BaseRun(Configurable):
             key: a run key
             new_key: a new run key
         """
-        if new_key in cls.list_runs(samples):
+        if cls._has_run(samples, new_key):
             raise ValueError(
                 "A %s with key '%s' already exists" % (cls._run_str(), new_key)
             )
 
         try:
             # Execute rename() method
-            run_info = cls.get_run_info(samples, key)
+            run_doc = cls._get_run_doc(samples, key)
+            run_info = cls._get_cached_run_info(key, run_doc)
             run = run_info.config.build()
             run.rename(samples, key, new_key)
         except Exception as e:
@@ -506,8 +512,9 @@ class BaseRun(Configurable):
         del run_docs[key]
         run_doc.key = new_key
         run_docs[new_key] = run_doc
+        _clear_cached_run_info(run_doc)
         run_doc.save()
-        dataset.save()
+        cls._save_run_refs(dataset, key, new_key)
 
         # Update results cache
         results_cache = getattr(dataset, cls._results_cache_field())
@@ -528,6 +535,10 @@ class BaseRun(Configurable):
             a :class:`BaseRunInfo`
         """
         run_doc = cls._get_run_doc(samples, key)
+        return cls._load_run_info(key, run_doc)
+
+    @classmethod
+    def _load_run_info(cls, key, run_doc):
         run_info_cls = cls.run_info_cls()
 
         try:
@@ -564,7 +575,7 @@ class BaseRun(Configurable):
         """
         key = run_info.key
 
-        if key in cls.list_runs(samples):
+        if cls._has_run(samples, key):
             if overwrite:
                 cls.delete_run(samples, key, cleanup=cleanup)
             else:
@@ -581,7 +592,7 @@ class BaseRun(Configurable):
             key=key,
             version=run_info.version,
             timestamp=run_info.timestamp,
-            config=deepcopy(run_info.config.serialize()),
+            config=run_info.config.serialize(),
             view_stages=[
                 json_util.dumps(s)
                 for s in samples.view()._serialize(include_uuids=False)
@@ -591,7 +602,7 @@ class BaseRun(Configurable):
         run_doc.save(upsert=True)
 
         run_docs[key] = run_doc
-        dataset.save()
+        cls._save_run_refs(dataset, key)
 
     @classmethod
     def update_run_config(cls, samples, key, config):
@@ -607,8 +618,9 @@ class BaseRun(Configurable):
             return
 
         run_doc = cls._get_run_doc(samples, key)
-        run_doc.config = deepcopy(config.serialize())
+        run_doc.config = config.serialize()
         run_doc.save()
+        _clear_cached_run_info(run_doc)
 
     @classmethod
     def save_run_results(
@@ -645,8 +657,8 @@ class BaseRun(Configurable):
         else:
             # Write run result to GridFS
             # We use `json_util.dumps` so that run results may contain BSON
-            results_bytes = json_util.dumps(run_results.serialize()).encode()
-            run_doc.results.put(results_bytes, content_type="application/json")
+            results_str = json_util.dumps(run_results.serialize())
+            _write_results_json(run_doc.results, results_str)
 
         # Cache the results for future use in this session
         if cache:
@@ -689,18 +701,18 @@ class BaseRun(Configurable):
             return None
 
         # Load run config
-        run_info = cls.get_run_info(samples, key)
+        run_info = cls._load_run_info(key, run_doc)
         config = run_info.config
         config.load_credentials(**kwargs)
 
         if load_view:
-            run_samples = cls.load_run_view(samples, key)
+            run_samples = cls._build_run_view(samples, run_doc)
         else:
             run_samples = dataset
 
         # Load run result from GridFS
         run_doc.results.seek(0)
-        d = json_util.loads(run_doc.results.read().decode())
+        d = _load_results_json(run_doc.results.read())
 
         try:
             run_results = BaseRunResults.from_dict(d, run_samples, config, key)
@@ -758,11 +770,8 @@ class BaseRun(Configurable):
         Returns:
             a :class:`fiftyone.core.view.DatasetView`
         """
-        import fiftyone.core.view as fov
-
         run_doc = cls._get_run_doc(samples, key)
-        stage_dicts = [json_util.loads(s) for s in run_doc.view_stages]
-        view = fov.DatasetView._build(samples._root_dataset, stage_dicts)
+        view = cls._build_run_view(samples, run_doc)
 
         if not select_fields:
             return view
@@ -807,18 +816,7 @@ class BaseRun(Configurable):
         run_doc = cls._get_run_doc(samples, key)
 
         if cleanup:
-            try:
-                # Execute cleanup() method
-                run_info = cls.get_run_info(samples, key)
-                run = run_info.config.build()
-                run.cleanup(samples, key)
-            except Exception as e:
-                logger.warning(
-                    "Failed to run cleanup() for the %s with key '%s': %s",
-                    cls._run_str(),
-                    key,
-                    str(e),
-                )
+            cls._cleanup_run(samples, key, run_doc)
 
         dataset = samples._root_dataset
 
@@ -841,7 +839,7 @@ class BaseRun(Configurable):
 
             run_doc.delete()
 
-        dataset.save()
+        cls._save_run_refs(dataset, key)
 
     @classmethod
     def delete_runs(cls, samples, cleanup=True):
@@ -852,8 +850,58 @@ class BaseRun(Configurable):
             cleanup (True): whether to execute the run's
                 :meth:`BaseRun.cleanup` methods
         """
-        for key in cls.list_runs(samples):
-            cls.delete_run(samples, key, cleanup=cleanup)
+        run_docs = cls._get_run_docs(samples)
+        if not run_docs:
+            return
+
+        if cleanup:
+            for key, run_doc in run_docs.items():
+                cls._cleanup_run(samples, key, run_doc)
+
+        dataset = samples._root_dataset
+
+        results_cache = getattr(dataset, cls._results_cache_field())
+        for key in run_docs.keys():
+            run_results = results_cache.pop(key, None)
+            if run_results is not None:
+                run_results._key = None
+
+        # Delete all run docs and their GridFS results in batches
+        run_ids = []
+        result_ids = []
+        for run_doc in run_docs.values():
+            run_ids.append(run_doc.id)
+            if run_doc.results:
+                result_ids.append(run_doc.results.grid_id)
+
+        conn = foo.get_db_conn()
+        if result_ids:
+            foo.database._delete_run_results(conn, result_ids)
+
+        foo.database._delete_run_docs(conn, run_ids)
+
+        # Delete runs from dataset
+        all_run_docs = getattr(dataset._doc, cls._runs_field())
+        for key in run_docs.keys():
+            # DON'T use pop()! https://github.com/voxel51/fiftyone/issues/4322
+            del all_run_docs[key]
+
+        cls._save_run_refs(dataset, *run_docs.keys())
+
+    @classmethod
+    def _cleanup_run(cls, samples, key, run_doc):
+        try:
+            # Execute cleanup() method
+            run_info = cls._get_cached_run_info(key, run_doc)
+            run = run_info.config.build()
+            run.cleanup(samples, key)
+        except Exception as e:
+            logger.warning(
+                "Failed to run cleanup() for the %s with key '%s': %s",
+                cls._run_str(),
+                key,
+                str(e),
+            )
 
     @classmethod
     def _get_run_docs(cls, samples):
@@ -863,20 +911,25 @@ class BaseRun(Configurable):
             if not isinstance(run_doc, DBRef):
                 run_docs[key] = run_doc
             else:
-                logger.warning(
-                    "This dataset's %s references are corrupted. Run %s('%s') "
-                    "and dataset.reload() to resolve",
-                    cls._run_str(),
-                    etau.get_function_name(cls._patch_function()),
-                    dataset._doc.name,
-                )
+                cls._warn_corrupted_run_docs(dataset)
 
         return run_docs
 
     @classmethod
-    def _get_run_doc(cls, samples, key):
-        run_docs = cls._get_run_docs(samples)
+    def _has_run(cls, samples, key):
+        run_docs = getattr(samples._root_dataset._doc, cls._runs_field())
         run_doc = run_docs.get(key, None)
+        return run_doc is not None and not isinstance(run_doc, DBRef)
+
+    @classmethod
+    def _get_run_doc(cls, samples, key):
+        dataset = samples._root_dataset
+        run_doc = getattr(dataset._doc, cls._runs_field()).get(key, None)
+
+        if isinstance(run_doc, DBRef):
+            cls._warn_corrupted_run_docs(dataset)
+            run_doc = None
+
         if run_doc is None:
             raise ValueError(
                 "Dataset has no %s key '%s'" % (cls._run_str(), key)
@@ -884,9 +937,80 @@ class BaseRun(Configurable):
 
         return run_doc
 
+    @classmethod
+    def _save_run_refs(cls, dataset, *keys):
+        # Persists only the given keys of the runs field, which avoids
+        # validating and serializing the entire dataset document
+        dataset_doc = dataset._doc
+        runs_field = cls._runs_field()
+        run_docs = getattr(dataset_doc, runs_field)
+
+        sets = {}
+        unsets = {}
+        for key in keys:
+            path = runs_field + "." + key
+            run_doc = run_docs.get(key, None)
+            if run_doc is not None:
+                sets[path] = run_doc.id
+            else:
+                unsets[path] = ""
+
+        updates = {}
+        if sets:
+            updates["$set"] = sets
+
+        if unsets:
+            updates["$unset"] = unsets
+
+        result = dataset_doc._get_collection().update_one(
+            {"_id": dataset_doc.id}, updates
+        )
+
+        if not result.matched_count:
+            dataset._deleted = True
+            raise ValueError("Dataset '%s' is deleted" % dataset.name)
+
+        # These changes no longer need to be saved
+        paths = set(sets.keys()) | set(unsets.keys())
+        dataset_doc._changed_fields = [
+            f for f in dataset_doc._changed_fields if f not in paths
+        ]
+
+    @classmethod
+    def _warn_corrupted_run_docs(cls, dataset):
+        logger.warning(
+            "This dataset's %s references are corrupted. Run %s('%s') and "
+            "dataset.reload() to resolve",
+            cls._run_str(),
+            etau.get_function_name(cls._patch_function()),
+            dataset._doc.name,
+        )
+
+    @classmethod
+    def _get_cached_run_info(cls, key, run_doc):
+        # Parsed run info is cached on the run document itself, so reloading
+        # the dataset, which creates new run documents, invalidates it
+        run_info = getattr(run_doc, "_run_info", None)
+        if run_info is None:
+            run_info = cls._load_run_info(key, run_doc)
+            run_doc._run_info = run_info
+
+        return run_info
+
+    @classmethod
+    def _build_run_view(cls, samples, run_doc):
+        import fiftyone.core.view as fov
+
+        # Parse all stages at once to avoid per-call decoder overhead
+        stage_dicts = json_util.loads(
+            "[" + ",".join(run_doc.view_stages) + "]"
+        )
+        return fov.DatasetView._build(samples._root_dataset, stage_dicts)
+
     @classmethod
     def _get_run_fields(cls, samples, key):
-        run_info = cls.get_run_info(samples, key)
+        run_doc = cls._get_run_doc(samples, key)
+        run_info = cls._get_cached_run_info(key, run_doc)
         run = run_info.config.build()
         return run.get_fields(samples, key)
 
@@ -1159,3 +1283,33 @@ class RunResults(BaseRunResults):
     @classmethod
     def _from_dict(cls, d, samples, config, key):
         return cls(samples, config, key, **d)
+
+
+def _clear_cached_run_info(run_doc):
+    run_doc._run_info = None
+
+
+def _write_results_json(results_file, results_str, chunk_size=1024**2):
+    # Encode in chunks so that a full-size bytes copy of the (potentially very
+    # large) results string is never materialized
+    results_file.new_file(content_type="application/json")
+
+    try:
+        for i in range(0, len(results_str), chunk_size):
+            results_file.write(results_str[i : i + chunk_size].encode())
+    except:
+        # Remove any partially written chunks and reset `grid_id` so that the
+        # document doesn't appear to have results
+        results_file.delete()
+        raise
+
+    results_file.close()
+
+
+def _load_results_json(results_bytes):
+    # `json_util` invokes a Python hook on every object in order to parse BSON
+    # extended JSON, which is only necessary if such values are present
+    if b'"$' in results_bytes:
+        return json_util.loads(results_bytes)
+
+    return json.loads(results_bytes)
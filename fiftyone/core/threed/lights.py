@@ -7,6 +7,7 @@ Lights definition for 3D visualization.
 """
 
 from math import pi as PI
+import sys
 from typing import Optional, Union
 
 from .object_3d import Object3D
@@ -18,7 +19,13 @@ from .transformation import (
     normalize_to_vec3,
 )
 
-COLOR_DEFAULT_WHITE = "#ffffff"
+COLOR_DEFAULT_WHITE = sys.intern("#ffffff")
+
+_ORIGIN = Vector3(0, 0, 0)
+
+
+def _make_repr_fmt(fields):
+    return "{}(%s)" % ", ".join("%s={!r}" % f for f in fields)
 
 
 class Light(Object3D):
@@ -33,6 +40,15 @@ class Light(Object3D):
         scale (None): the scale of the light in object space
     """
 
+    __slots__ = ("color", "intensity")
+
+    _REPR_FIELDS = ("name", "color", "intensity")
+    _REPR_FMT = _make_repr_fmt(_REPR_FIELDS)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._REPR_FMT = _make_repr_fmt(cls._REPR_FIELDS)
+
     def __init__(
         self,
         name: Union[str, None] = None,
@@ -53,14 +69,17 @@ class Light(Object3D):
         self.color = color
         self.intensity = intensity
 
+    def __repr__(self):
+        return self._REPR_FMT.format(
+            self.__class__.__name__,
+            *(getattr(self, f) for f in self._REPR_FIELDS),
+        )
+
     def _to_dict_extra(self):
-        return {
-            **super()._to_dict_extra(),
-            **{
-                "color": self.color,
-                "intensity": self.intensity,
-            },
-        }
+        r = super()._to_dict_extra()
+        r["color"] = self.color
+        r["intensity"] = self.intensity
+        return r
 
 
 class AmbientLight(Light):
@@ -78,6 +97,8 @@ class AmbientLight(Light):
         scale (None): the scale of the light in object space
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         name: str = "AmbientLight",
@@ -98,16 +119,6 @@ class AmbientLight(Light):
             quaternion=quaternion,
         )
 
-    def __repr__(self):
-        kwargs_list = []
-        for k, v in [
-            ("name", self.name),
-            ("color", self.color),
-            ("intensity", self.intensity),
-        ]:
-            kwargs_list.append(f"{k}={repr(v)}")
-        return f"{self.__class__.__name__}({', '.join(kwargs_list)})"
-
 
 class DirectionalLight(Light):
     """Represents a directional light.
@@ -118,7 +129,8 @@ class DirectionalLight(Light):
 
     Args:
         name ("DirectionalLight"): the name of the light
-        target ([0,0,0]): the target of the light
+        target (None): the target of the light. By default, the light
+            targets the origin
         color ("#ffffff"): the color of the light
         intensity (1.0): the intensity of the light in the range ``[0, 1]``
         visible (True): default visibility of the object in the scene
@@ -127,12 +139,14 @@ class DirectionalLight(Light):
         scale (None): the scale of the light in object space
     """
 
-    target: Vec3UnionType = Vector3(0, 0, 0)
+    __slots__ = ("_target", "_target_list")
+
+    _REPR_FIELDS = ("name", "target", "color", "intensity")
 
     def __init__(
         self,
         name: str = "DirectionalLight",
-        target: Vec3UnionType = Vector3(0, 0, 0),
+        target: Optional[Vec3UnionType] = None,
         color: str = COLOR_DEFAULT_WHITE,
         intensity: float = 1.0,
         visible=True,
@@ -149,24 +163,25 @@ class DirectionalLight(Light):
             scale=scale,
             quaternion=quaternion,
         )
-        self.target = normalize_to_vec3(target)
+        self.target = _ORIGIN if target is None else target
 
-    def __repr__(self):
-        kwargs_list = []
-        for k, v in [
-            ("name", self.name),
-            ("target", self.target),
-            ("color", self.color),
-            ("intensity", self.intensity),
-        ]:
-            kwargs_list.append(f"{k}={repr(v)}")
-        return f"{self.__class__.__name__}({', '.join(kwargs_list)})"
+    @property
+    def target(self):
+        """The target of the light."""
+        return self._target
+
+    @target.setter
+    def target(self, value: Vec3UnionType):
+        if value.__class__ is not Vector3:
+            value = normalize_to_vec3(value)
+
+        self._target = value
+        self._target_list = value.to_arr().tolist()
 
     def _to_dict_extra(self):
-        return {
-            **super()._to_dict_extra(),
-            **{"target": self.target.to_arr().tolist()},
-        }
+        r = super()._to_dict_extra()
+        r["target"] = list(self._target_list)
+        return r
 
 
 class PointLight(Light):
@@ -184,6 +199,10 @@ class PointLight(Light):
         scale (None): the scale of the light in object space
     """
 
+    __slots__ = ("distance", "decay")
+
+    _REPR_FIELDS = ("name", "distance", "decay", "color", "intensity")
+
     def __init__(
         self,
         name: str = "PointLight",
@@ -208,26 +227,11 @@ class PointLight(Light):
         self.distance = distance
         self.decay = decay
 
-    def __repr__(self):
-        kwargs_list = []
-        for k, v in [
-            ("name", self.name),
-            ("distance", self.distance),
-            ("decay", self.decay),
-            ("color", self.color),
-            ("intensity", self.intensity),
-        ]:
-            kwargs_list.append(f"{k}={repr(v)}")
-        return f"{self.__class__.__name__}({', '.join(kwargs_list)})"
-
     def _to_dict_extra(self):
-        return {
-            **super()._to_dict_extra(),
-            **{
-                "distance": self.distance,
-                "decay": self.decay,
-            },
-        }
+        r = super()._to_dict_extra()
+        r["distance"] = self.distance
+        r["decay"] = self.decay
+        return r
 
 
 class SpotLight(Light):
@@ -235,7 +239,8 @@ class SpotLight(Light):
 
     Args:
         name ("SpotLight"): the name of the light
-        target ([0,0,0]): the target of the light
+        target (None): the target of the light. By default, the light
+            targets the origin
         distance (0.0): the distance at which the light's intensity is zero
         decay (2.0): the amount the light dims along the distance of the light
         angle (PI / 3): the angle of the light's spotlight, in radians
@@ -247,10 +252,30 @@ class SpotLight(Light):
         quaternion (None): the quaternion of the light in object space
         scale (None): the scale of the light in object space"""
 
+    __slots__ = (
+        "_target",
+        "_target_list",
+        "distance",
+        "decay",
+        "angle",
+        "penumbra",
+    )
+
+    _REPR_FIELDS = (
+        "name",
+        "target",
+        "distance",
+        "decay",
+        "angle",
+        "penumbra",
+        "color",
+        "intensity",
+    )
+
     def __init__(
         self,
         name: str = "SpotLight",
-        target: Vec3UnionType = None,
+        target: Optional[Vec3UnionType] = None,
         distance: float = 0.0,
         decay: float = 2.0,
         angle: float = PI / 3,
@@ -271,35 +296,30 @@ class SpotLight(Light):
             scale=scale,
             quaternion=quaternion,
         )
-        self.target = normalize_to_vec3(target) if target else Vector3(0, 0, 0)
+        self.target = _ORIGIN if target is None else target
         self.distance = distance
         self.decay = decay
         self.angle = angle
         self.penumbra = penumbra
 
-    def __repr__(self):
-        kwargs_list = []
-        for k, v in [
-            ("name", self.name),
-            ("target", self.target),
-            ("distance", self.distance),
-            ("decay", self.decay),
-            ("angle", self.angle),
-            ("penumbra", self.penumbra),
-            ("color", self.color),
-            ("intensity", self.intensity),
-        ]:
-            kwargs_list.append(f"{k}={repr(v)}")
-        return f"{self.__class__.__name__}({', '.join(kwargs_list)})"
+    @property
+    def target(self):
+        """The target of the light."""
+        return self._target
+
+    @target.setter
+    def target(self, value: Vec3UnionType):
+        if value.__class__ is not Vector3:
+            value = normalize_to_vec3(value)
+
+        self._target = value
+        self._target_list = value.to_arr().tolist()
 
     def _to_dict_extra(self):
-        return {
-            **super()._to_dict_extra(),
-            **{
-                "target": self.target.to_arr().tolist(),
-                "distance": self.distance,
-                "decay": self.decay,
-                "angle": self.angle,
-                "penumbra": self.penumbra,
-            },
-        }
+        r = super()._to_dict_extra()
+        r["target"] = list(self._target_list)
+        r["distance"] = self.distance
+        r["decay"] = self.decay
+        r["angle"] = self.angle
+        r["penumbra"] = self.penumbra
+        return r
@@ -11,6 +11,7 @@ from typing import Optional
 from .material_3d import MeshMaterial, MeshStandardMaterial
 from .object_3d import Object3D
 from .transformation import Quaternion, Vec3UnionType
+from .utils import _has_ext
 
 
 class Mesh(Object3D):
@@ -28,6 +29,11 @@ class Mesh(Object3D):
         scale (None): the scale of the mesh in object space
     """
 
+    __slots__ = ("default_material",)
+
+    _ASSET_TYPE = None
+    _ALLOWED_EXTS = None
+
     def __init__(
         self,
         name: str,
@@ -45,10 +51,19 @@ class Mesh(Object3D):
             quaternion=quaternion,
         )
 
-        if isinstance(material, dict):
+        if material is None:
+            material = MeshStandardMaterial()
+        elif isinstance(material, dict):
             material = MeshMaterial._from_dict(material)
 
-        self.default_material = material or MeshStandardMaterial()
+        self.default_material = material
+
+    def _validate_path(self, path):
+        if not _has_ext(path, self._ALLOWED_EXTS):
+            raise ValueError(
+                "%s must be a %s file"
+                % (self._ASSET_TYPE, " or ".join(self._ALLOWED_EXTS))
+            )
 
     def set_default_material(self, material: MeshMaterial):
         """Sets the material of the mesh.
@@ -90,8 +105,18 @@ class ObjMesh(Mesh):
         ValueError: if ``mtl_path`` does not end with ``.mtl``
     """
 
+    __slots__ = (
+        "obj_path",
+        "mtl_path",
+        "_pre_transformed_obj_path",
+        "_pre_transformed_mtl_path",
+    )
+
     _asset_path_fields = ["obj_path", "mtl_path"]
 
+    _ASSET_TYPE = "OBJ mesh"
+    _ALLOWED_EXTS = (".obj",)
+
     def __init__(
         self,
         name: str,
@@ -112,8 +137,7 @@ class ObjMesh(Mesh):
             quaternion=quaternion,
         )
 
-        if not obj_path.lower().endswith(".obj"):
-            raise ValueError("OBJ mesh must be a .obj file")
+        self._validate_path(obj_path)
 
         self.obj_path = obj_path
 
@@ -122,19 +146,18 @@ class ObjMesh(Mesh):
 
         self.mtl_path = mtl_path
 
+        self._pre_transformed_obj_path = None
+        self._pre_transformed_mtl_path = None
+
     def _to_dict_extra(self):
-        r = {
-            **super()._to_dict_extra(),
-            **{
-                "objPath": self.obj_path,
-                "mtlPath": self.mtl_path,
-            },
-        }
-
-        if hasattr(self, "_pre_transformed_obj_path"):
+        r = super()._to_dict_extra()
+        r["objPath"] = self.obj_path
+        r["mtlPath"] = self.mtl_path
+
+        if self._pre_transformed_obj_path is not None:
             r["preTransformedObjPath"] = self._pre_transformed_obj_path
 
-        if hasattr(self, "_pre_transformed_mtl_path"):
+        if self._pre_transformed_mtl_path is not None:
             r["preTransformedMtlPath"] = self._pre_transformed_mtl_path
 
         return r
@@ -161,8 +184,13 @@ class FbxMesh(Mesh):
         ValueError: If ``fbx_path`` does not end with ``.fbx``
     """
 
+    __slots__ = ("fbx_path", "_pre_transformed_fbx_path")
+
     _asset_path_fields = ["fbx_path"]
 
+    _ASSET_TYPE = "FBX mesh"
+    _ALLOWED_EXTS = (".fbx",)
+
     def __init__(
         self,
         name: str,
@@ -182,18 +210,16 @@ class FbxMesh(Mesh):
             quaternion=quaternion,
         )
 
-        if not (fbx_path.lower().endswith(".fbx")):
-            raise ValueError("FBX mesh must be a .fbx file")
+        self._validate_path(fbx_path)
 
         self.fbx_path = fbx_path
+        self._pre_transformed_fbx_path = None
 
     def _to_dict_extra(self):
-        r = {
-            **super()._to_dict_extra(),
-            **{"fbxPath": self.fbx_path},
-        }
+        r = super()._to_dict_extra()
+        r["fbxPath"] = self.fbx_path
 
-        if hasattr(self, "_pre_transformed_fbx_path"):
+        if self._pre_transformed_fbx_path is not None:
             r["preTransformedFbxPath"] = self._pre_transformed_fbx_path
 
         return r
@@ -221,8 +247,13 @@ class GltfMesh(Mesh):
         ValueError: if ``gltf_path`` does not end with '.gltf' or ``.glb``
     """
 
+    __slots__ = ("gltf_path", "_pre_transformed_gltf_path")
+
     _asset_path_fields = ["gltf_path"]
 
+    _ASSET_TYPE = "gLTF mesh"
+    _ALLOWED_EXTS = (".gltf", ".glb")
+
     def __init__(
         self,
         name: str,
@@ -242,18 +273,16 @@ class GltfMesh(Mesh):
             quaternion=quaternion,
         )
 
-        if not (
-            gltf_path.lower().endswith(".gltf")
-            or gltf_path.lower().endswith(".glb")
-        ):
-            raise ValueError("gLTF mesh must be a .gltf or .glb file")
+        self._validate_path(gltf_path)
 
         self.gltf_path = gltf_path
+        self._pre_transformed_gltf_path = None
 
     def _to_dict_extra(self):
-        r = {**super()._to_dict_extra(), **{"gltfPath": self.gltf_path}}
+        r = super()._to_dict_extra()
+        r["gltfPath"] = self.gltf_path
 
-        if hasattr(self, "_pre_transformed_gltf_path"):
+        if self._pre_transformed_gltf_path is not None:
             r["preTransformedGltfPath"] = self._pre_transformed_gltf_path
 
         return r
@@ -284,8 +313,13 @@ class PlyMesh(Mesh):
         ValueError: if ``ply_path`` does not end with ``.ply``
     """
 
+    __slots__ = ("ply_path", "is_point_cloud", "_pre_transformed_ply_path")
+
     _asset_path_fields = ["ply_path"]
 
+    _ASSET_TYPE = "PLY mesh"
+    _ALLOWED_EXTS = (".ply",)
+
     def __init__(
         self,
         name: str,
@@ -306,19 +340,18 @@ class PlyMesh(Mesh):
             quaternion=quaternion,
         )
 
-        if not ply_path.lower().endswith(".ply"):
-            raise ValueError("PLY mesh must be a .ply file")
+        self._validate_path(ply_path)
 
         self.ply_path = ply_path
         self.is_point_cloud = is_point_cloud
+        self._pre_transformed_ply_path = None
 
     def _to_dict_extra(self):
-        r = {
-            **super()._to_dict_extra(),
-            **{"plyPath": self.ply_path, "isPointCloud": self.is_point_cloud},
-        }
+        r = super()._to_dict_extra()
+        r["plyPath"] = self.ply_path
+        r["isPointCloud"] = self.is_point_cloud
 
-        if hasattr(self, "_pre_transformed_ply_path"):
+        if self._pre_transformed_ply_path is not None:
             r["preTransformedPlyPath"] = self._pre_transformed_ply_path
 
         return r
@@ -345,8 +378,13 @@ class StlMesh(Mesh):
         ValueError: if ``stl_path`` does not end with ``.stl``
     """
 
+    __slots__ = ("stl_path", "_pre_transformed_stl_path")
+
     _asset_path_fields = ["stl_path"]
 
+    _ASSET_TYPE = "STL mesh"
+    _ALLOWED_EXTS = (".stl",)
+
     def __init__(
         self,
         name: str,
@@ -366,15 +404,16 @@ class StlMesh(Mesh):
             quaternion=quaternion,
         )
 
-        if not stl_path.lower().endswith(".stl"):
-            raise ValueError("STL mesh must be a .stl file")
+        self._validate_path(stl_path)
 
         self.stl_path = stl_path
+        self._pre_transformed_stl_path = None
 
     def _to_dict_extra(self):
-        r = {**super()._to_dict_extra(), **{"stlPath": self.stl_path}}
+        r = super()._to_dict_extra()
+        r["stlPath"] = self.stl_path
 
-        if hasattr(self, "_pre_transformed_stl_path"):
+        if self._pre_transformed_stl_path is not None:
             r["preTransformedStlPath"] = self._pre_transformed_stl_path
 
         return r
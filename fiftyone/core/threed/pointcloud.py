@@ -11,6 +11,7 @@ from typing import Optional
 from .material_3d import PointCloudMaterial
 from .object_3d import Object3D
 from .transformation import Quaternion, Vec3UnionType
+from .utils import _has_ext
 
 
 class PointCloud(Object3D):
@@ -38,6 +39,13 @@ class PointCloud(Object3D):
         ValueError: if ``pcd_path`` does not end with ``.pcd``
     """
 
+    __slots__ = (
+        "pcd_path",
+        "default_material",
+        "flag_for_projection",
+        "_pre_transformed_pcd_path",
+    )
+
     _asset_path_fields = ["pcd_path"]
 
     def __init__(
@@ -59,15 +67,18 @@ class PointCloud(Object3D):
             quaternion=quaternion,
         )
 
-        if not pcd_path.lower().endswith(".pcd"):
+        if not _has_ext(pcd_path, (".pcd",)):
             raise ValueError("Point cloud must be a .pcd file")
 
         self.pcd_path = pcd_path
+        self._pre_transformed_pcd_path = None
 
-        if isinstance(material, dict):
+        if material is None:
+            material = PointCloudMaterial()
+        elif isinstance(material, dict):
             material = PointCloudMaterial._from_dict(material)
 
-        self.default_material = material or PointCloudMaterial()
+        self.default_material = material
         self.flag_for_projection = flag_for_projection
 
     def set_default_material(self, material: PointCloudMaterial):
@@ -89,7 +100,7 @@ class PointCloud(Object3D):
             "flagForProjection": self.flag_for_projection,
         }
 
-        if hasattr(self, "_pre_transformed_pcd_path"):
+        if self._pre_transformed_pcd_path is not None:
             r["preTransformedPcdPath"] = self._pre_transformed_pcd_path
 
         return r
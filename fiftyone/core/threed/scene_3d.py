@@ -210,7 +210,12 @@ class Scene(Object3D):
         if not fo3d_path.endswith(".fo3d"):
             raise ValueError("Scene must be exported to a .fo3d file")
 
-        validated_scene = self.copy()
+        if resolve_relative_paths:
+            validated_scene = self.copy()
+        else:
+            # The scene is only read below, so avoid the extra serialization
+            # round trip that copy() performs
+            validated_scene = self
 
         fo3d_path_dir = os.path.dirname(fo3d_path)
 
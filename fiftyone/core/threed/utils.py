@@ -42,3 +42,9 @@ def convert_keys_to_snake_case(d):
         return [convert_keys_to_snake_case(item) for item in d]
     else:
         return d
+
+
+def _has_ext(path, exts):
+    # Only lowercase the tail of the path rather than the entire path
+    n = max(len(ext) for ext in exts)
+    return path[-n:].lower().endswith(exts)
@@ -523,12 +523,16 @@ class DatasetView(foc.SampleCollection):
                 if autosave:
                     save_context.save(sample)
 
-    def _iter_samples(self):
+    def _iter_samples(self, pipeline=None):
         make_sample = self._make_sample_fcn()
         index = 0
 
         try:
-            for d in self._aggregate(detach_frames=True, detach_groups=True):
+            for d in self._aggregate(
+                pipeline=pipeline,
+                detach_frames=True,
+                detach_groups=True,
+            ):
                 sample = make_sample(d)
 
                 index += 1
@@ -537,7 +541,7 @@ class DatasetView(foc.SampleCollection):
             # The cursor has timed out so we yield from a new one after
             # skipping to the last offset
             view = self.skip(index)
-            for sample in view._iter_samples():
+            for sample in view._iter_samples(pipeline=pipeline):
                 yield sample
 
     def _make_sample_fcn(self):
@@ -8,6 +8,8 @@ FiftyOne run-related unit tests.
 import unittest
 
 import fiftyone as fo
+import fiftyone.core.odm as foo
+import fiftyone.core.runs as fors
 
 from decorators import drop_datasets
 
@@ -129,6 +131,98 @@ class RunTests(unittest.TestCase):
         runs = dataset.list_runs(method="test")
         self.assertListEqual(runs, ["custom2"])
 
+    @drop_datasets
+    def test_list_runs_kwargs_updates(self):
+        dataset = fo.Dataset()
+
+        config = dataset.init_run(foo="bar")
+        dataset.register_run("custom", config)
+
+        self.assertListEqual(dataset.list_runs(foo="bar"), ["custom"])
+
+        config.foo = "eggs"
+        dataset.update_run_config("custom", config)
+
+        self.assertListEqual(dataset.list_runs(foo="bar"), [])
+        self.assertListEqual(dataset.list_runs(foo="eggs"), ["custom"])
+
+        dataset.rename_run("custom", "still_custom")
+
+        self.assertListEqual(dataset.list_runs(foo="eggs"), ["still_custom"])
+
+        info = dataset.get_run_info("still_custom")
+        self.assertEqual(info.key, "still_custom")
+
+        config = dataset.init_run(foo="bar")
+        dataset.register_run("still_custom", config, overwrite=True)
+
+        self.assertListEqual(dataset.list_runs(foo="bar"), ["still_custom"])
+
+    @drop_datasets
+    def test_delete_runs(self):
+        dataset = fo.Dataset()
+
+        for key in ("custom1", "custom2", "custom3"):
+            config = dataset.init_run(foo="bar")
+            dataset.register_run(key, config)
+
+            if key != "custom3":
+                results = dataset.init_run_results(key, spam="eggs")
+                dataset.save_run_results(key, results)
+
+        run_docs = list(dataset._doc.runs.values())
+        run_ids = [run_doc.id for run_doc in run_docs]
+        result_ids = [d.results.grid_id for d in run_docs if d.results]
+        self.assertEqual(len(result_ids), 2)
+
+        dataset.delete_runs()
+
+        self.assertFalse(dataset.has_runs)
+        self.assertListEqual(dataset.list_runs(), [])
+
+        conn = foo.get_db_conn()
+        self.assertEqual(
+            conn.runs.count_documents({"_id": {"$in": run_ids}}), 0
+        )
+        self.assertEqual(
+            conn.fs.files.count_documents({"_id": {"$in": result_ids}}), 0
+        )
+
+        dataset.reload()
+
+        self.assertFalse(dataset.has_runs)
+        self.assertListEqual(dataset.list_runs(), [])
+
+    @drop_datasets
+    def test_save_run_results_write_failure(self):
+        dataset = fo.Dataset()
+
+        config = dataset.init_run()
+        dataset.register_run("custom", config)
+
+        # A lone surrogate can't be encoded, so the second chunk fails
+        run_doc = dataset._doc.runs["custom"]
+        with self.assertRaises(UnicodeEncodeError):
+            fors._write_results_json(
+                run_doc.results, "a" * 8 + "\ud800", chunk_size=4
+            )
+
+        grid_id = run_doc.results.newfile._id
+        self.assertFalse(run_doc.results)
+
+        conn = foo.get_db_conn()
+        self.assertEqual(
+            conn.fs.chunks.count_documents({"files_id": grid_id}), 0
+        )
+        self.assertEqual(conn.fs.files.count_documents({"_id": grid_id}), 0)
+
+        results = dataset.init_run_results("custom", foo="bar")
+        dataset.save_run_results("custom", results, overwrite=False)
+
+        dataset.clear_cache()
+        results = dataset.load_run_results("custom")
+        self.assertEqual(results.foo, "bar")
+
     @drop_datasets
     def test_concurrent_run_updates(self):
         dataset = fo.Dataset()
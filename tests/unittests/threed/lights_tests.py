@@ -0,0 +1,98 @@
+"""
+FiftyOne 3D lights unit tests.
+
+| Copyright 2017-2024, Voxel51, Inc.
+| `voxel51.com <https://voxel51.com/>`_
+|
+"""
+
+import unittest
+
+import numpy as np
+
+from fiftyone.core.threed import (
+    AmbientLight,
+    DirectionalLight,
+    PointLight,
+    SpotLight,
+    Vector3,
+)
+
+
+class TestLightsRepr(unittest.TestCase):
+    def test_ambient_light_repr(self):
+        light = AmbientLight(intensity=0.5)
+        self.assertEqual(
+            repr(light),
+            "AmbientLight(name='AmbientLight', color='#ffffff', "
+            "intensity=0.5)",
+        )
+
+    def test_directional_light_repr(self):
+        light = DirectionalLight(target=[1, 2, 3], color="#ff0000")
+        self.assertEqual(
+            repr(light),
+            "DirectionalLight(name='DirectionalLight', "
+            "target=Vector3(x=1.0, y=2.0, z=3.0), color='#ff0000', "
+            "intensity=1.0)",
+        )
+
+    def test_point_light_repr(self):
+        light = PointLight(name="point", distance=10.0)
+        self.assertEqual(
+            repr(light),
+            "PointLight(name='point', distance=10.0, decay=2.0, "
+            "color='#ffffff', intensity=1.0)",
+        )
+
+    def test_spot_light_repr(self):
+        light = SpotLight(angle=0.5, penumbra=0.1)
+        self.assertEqual(
+            repr(light),
+            "SpotLight(name='SpotLight', target=Vector3(x=0.0, y=0.0, z=0.0), "
+            "distance=0.0, decay=2.0, angle=0.5, penumbra=0.1, "
+            "color='#ffffff', intensity=1.0)",
+        )
+
+
+class TestLightsSerialization(unittest.TestCase):
+    def test_directional_light_to_dict(self):
+        light = DirectionalLight(target=Vector3(1, 2, 3), intensity=0.5)
+        d = light.as_dict()
+
+        self.assertEqual(d["_type"], "DirectionalLight")
+        self.assertEqual(d["target"], [1.0, 2.0, 3.0])
+        self.assertEqual(d["color"], "#ffffff")
+        self.assertEqual(d["intensity"], 0.5)
+
+    def test_spot_light_to_dict(self):
+        light = SpotLight(target=[1, 0, 0], distance=5.0, decay=1.0)
+        d = light.as_dict()
+
+        self.assertEqual(d["_type"], "SpotLight")
+        self.assertEqual(d["target"], [1.0, 0.0, 0.0])
+        self.assertEqual(d["distance"], 5.0)
+        self.assertEqual(d["decay"], 1.0)
+        self.assertEqual(d["color"], "#ffffff")
+        self.assertEqual(d["intensity"], 1.0)
+
+    def test_target_update_to_dict(self):
+        for light in (DirectionalLight(), SpotLight()):
+            self.assertEqual(light.as_dict()["target"], [0.0, 0.0, 0.0])
+
+            light.target = [4, 5, 6]
+            self.assertEqual(light.target, Vector3(4, 5, 6))
+            self.assertEqual(light.as_dict()["target"], [4.0, 5.0, 6.0])
+
+            with self.assertRaises(ValueError):
+                light.target = [1, 2]
+
+    def test_array_like_targets(self):
+        for target in ([0, 0, 0], (1, 2, 3), np.array([1.0, 2.0, 3.0])):
+            light = SpotLight(target=target)
+            self.assertEqual(light.as_dict()["target"], list(target))
+
+    def test_default_targets(self):
+        for light in (DirectionalLight(target=None), SpotLight(target=None)):
+            self.assertEqual(light.target, Vector3(0, 0, 0))
+            self.assertEqual(light.as_dict()["target"], [0.0, 0.0, 0.0])
@@ -0,0 +1,96 @@
+"""
+FiftyOne 3D mesh unit tests.
+
+| Copyright 2017-2024, Voxel51, Inc.
+| `voxel51.com <https://voxel51.com/>`_
+|
+"""
+
+import unittest
+
+from fiftyone.core.threed import (
+    FbxMesh,
+    GltfMesh,
+    ObjMesh,
+    PlyMesh,
+    PointCloud,
+    PointCloudMaterial,
+    StlMesh,
+)
+
+
+class TestMeshPathValidation(unittest.TestCase):
+    def test_valid_extensions(self):
+        ObjMesh("obj", "/path/to/mesh.obj", mtl_path="mesh.mtl")
+        ObjMesh("obj", "/path/to/MESH.OBJ")
+        FbxMesh("fbx", "/path/to/mesh.Fbx")
+        GltfMesh("gltf", "/path/to/mesh.gltf")
+        GltfMesh("glb", "/path/to/mesh.GLB")
+        PlyMesh("ply", "/path/to/mesh.ply")
+        StlMesh("stl", "/path/to/mesh.STL")
+        PointCloud("pcd", "/path/to/cloud.Pcd")
+
+    def test_invalid_extensions(self):
+        with self.assertRaises(ValueError):
+            ObjMesh("obj", "/path/to/mesh.stl")
+
+        with self.assertRaises(ValueError):
+            ObjMesh("obj", "/path/to/mesh.obj", mtl_path="mesh.txt")
+
+        with self.assertRaises(ValueError):
+            FbxMesh("fbx", "/path/to/mesh.obj")
+
+        with self.assertRaises(ValueError):
+            GltfMesh("gltf", "/path/to/mesh.glbx")
+
+        with self.assertRaises(ValueError):
+            PlyMesh("ply", "ply")
+
+        with self.assertRaises(ValueError):
+            StlMesh("stl", "")
+
+        with self.assertRaises(ValueError):
+            PointCloud("pcd", "/path/to/cloud.ply")
+
+
+class TestMeshDefaultMaterial(unittest.TestCase):
+    def test_default_materials_are_not_shared(self):
+        pcd1 = PointCloud("pcd1", "cloud1.pcd")
+        pcd2 = PointCloud("pcd2", "cloud2.pcd")
+        self.assertIsNot(pcd1.default_material, pcd2.default_material)
+
+        pcd1.default_material.point_size = 5.0
+        self.assertNotEqual(pcd2.default_material.point_size, 5.0)
+
+        mesh1 = StlMesh("mesh1", "mesh1.stl")
+        mesh2 = StlMesh("mesh2", "mesh2.stl")
+        self.assertIsNot(mesh1.default_material, mesh2.default_material)
+
+    def test_material_from_dict(self):
+        pcd = PointCloud(
+            "pcd",
+            "cloud.pcd",
+            material={"_type": "PointCloudMaterial", "point_size": 3.0},
+        )
+        self.assertIsInstance(pcd.default_material, PointCloudMaterial)
+        self.assertEqual(pcd.default_material.point_size, 3.0)
+
+
+class TestMeshSerialization(unittest.TestCase):
+    def test_pre_transformed_paths(self):
+        pcd = PointCloud("pcd", "cloud.pcd")
+        self.assertNotIn("preTransformedPcdPath", pcd.as_dict())
+
+        pcd._pre_transformed_pcd_path = "transformed.pcd"
+        d = pcd.as_dict()
+        self.assertEqual(d["preTransformedPcdPath"], "transformed.pcd")
+
+        obj = ObjMesh("obj", "mesh.obj", mtl_path="mesh.mtl")
+        d = obj.as_dict()
+        self.assertNotIn("preTransformedObjPath", d)
+        self.assertNotIn("preTransformedMtlPath", d)
+
+        obj._pre_transformed_obj_path = "transformed.obj"
+        d = obj.as_dict()
+        self.assertEqual(d["preTransformedObjPath"], "transformed.obj")
+        self.assertNotIn("preTransformedMtlPath", d)